@@ -0,0 +1,292 @@
+"""
+Semantic Cache Module
+
+This module implements an embedding-based response cache for AI providers.
+Prompts are embedded with a sentence-transformers model and compared against
+previously answered prompts by cosine similarity, so paraphrased repeats are
+served from memory instead of paying for another LLM round-trip.
+
+Embeddings are kept L2-normalized in a preallocated ``(max_size, dim)`` float32
+matrix, which turns a lookup into a single matrix-vector product. Entries are
+evicted in least-recently-used order.
+
+The embedding model is an optional dependency (``uv sync --extra cache``). When
+``sentence-transformers`` is not installed, or the model cannot be loaded, the
+cache only serves exact repeats.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import cache
+from pathlib import Path
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+Encoder = Callable[[list[str]], np.ndarray]
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+@cache
+def _load_encoder(model_name: str) -> Encoder | None:
+    """
+    Load a sentence-transformers model once per process.
+
+    Args:
+        model_name (str): Name of the sentence-transformers model to load
+
+    Returns:
+        Encoder | None: Callable mapping texts to embeddings, or None if
+            sentence-transformers is not installed or the model cannot be loaded
+    """
+    try:
+        from sentence_transformers import SentenceTransformer  # noqa: PLC0415
+    except ImportError:
+        logger.warning("semantic_cache_encoder_unavailable", model=model_name)
+        return None
+
+    try:
+        model = SentenceTransformer(model_name)
+    except Exception as e:  # noqa: BLE001
+        # e.g. OSError when the model is neither cached nor downloadable; the
+        # failure is cached too, so the download is not retried on every lookup
+        logger.warning(
+            "semantic_cache_encoder_load_failed", model=model_name, error=str(e)
+        )
+        return None
+
+    def encode(texts: list[str]) -> np.ndarray:
+        return model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
+
+    return encode
+
+
+class SemanticCache:
+    """
+    LRU cache of AI responses keyed by the meaning of the prompt.
+
+    Attributes:
+        namespace (str): Name of the cache, used for logging and persistence
+        threshold (float): Minimum cosine similarity for a cache hit
+        max_size (int): Maximum number of cached responses
+        exact (bool): Whether only exact repeats of a key are served
+        logger (BoundLogger): Structured logger bound with the cache namespace
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        namespace: str,
+        threshold: float = 0.87,
+        max_size: int = 256,
+        encoder: Encoder | None = None,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        *,
+        exact: bool = False,
+    ) -> None:
+        """
+        Initialize an empty semantic cache.
+
+        Args:
+            namespace (str): Name of the cache, e.g. the prompt template it serves
+            threshold (float): Minimum cosine similarity for a cache hit
+            max_size (int): Maximum number of cached responses
+            encoder (Encoder | None): Embedding function, defaults to the
+                sentence-transformers model given by ``model_name``
+            model_name (str): sentence-transformers model used when no encoder
+                is given
+            exact (bool): Only serve exact repeats of a key, for responses that
+                depend on details a paraphrase may change, e.g. a ticker
+        """
+        self.namespace = namespace
+        self.threshold = threshold
+        self.max_size = max_size
+        self.exact = exact
+        self._encoder = encoder
+        self._model_name = model_name
+        self._embeddings: np.ndarray | None = None
+        self._keys: list[str] = [""] * max_size
+        self._responses: list[str] = [""] * max_size
+        # Maps each cached key to its row, ordered from least to most recently used
+        self._slots: OrderedDict[str, int] = OrderedDict()
+        self.logger = logger.bind(cache=namespace)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def warm_up(self) -> None:
+        """Load the embedding model now, so the first lookup does not wait on it."""
+        if not self.exact and self._encoder is None:
+            _load_encoder(self._model_name)
+
+    def _embed(self, text: str) -> np.ndarray | None:
+        """Embed a single text as a normalized float32 vector."""
+        if self.exact:
+            return None
+        encoder = self._encoder or _load_encoder(self._model_name)
+        if encoder is None:
+            return None
+        try:
+            embedding = encoder([text])[0]
+        except Exception as e:  # noqa: BLE001
+            self.logger.warning("cache_embed_failed", error=str(e))
+            return None
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _lookup(self, key: str, vector: np.ndarray | None) -> str | None:
+        """Find the closest cached response, marking it as recently used."""
+        row = self._slots.get(key)
+        if row is None and vector is not None and self._embeddings is not None:
+            scores = self._embeddings @ vector
+            best = int(scores.argmax())
+            if scores[best] >= self.threshold:
+                row = best
+        if row is None:
+            return None
+        self._slots.move_to_end(self._keys[row])
+        self.logger.debug("cache_hit", key=key, matched=self._keys[row])
+        return self._responses[row]
+
+    def _insert(self, key: str, vector: np.ndarray | None, response: str) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        if key in self._slots:
+            row = self._slots[key]
+            self._slots.move_to_end(key)
+        elif len(self._slots) < self.max_size:
+            row = len(self._slots)
+            self._slots[key] = row
+        else:
+            _, row = self._slots.popitem(last=False)
+            self._slots[key] = row
+
+        if vector is not None:
+            if self._embeddings is None:
+                self._embeddings = np.zeros(
+                    (self.max_size, vector.shape[0]), dtype=np.float32
+                )
+            self._embeddings[row] = vector
+        elif self._embeddings is not None:
+            self._embeddings[row] = 0.0
+        self._keys[row] = key
+        self._responses[row] = response
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a cached response for a prompt.
+
+        Args:
+            key (str): Prompt or user input the response was generated for
+
+        Returns:
+            str | None: Cached response, or None on a cache miss
+        """
+        return self._lookup(key, None if key in self._slots else self._embed(key))
+
+    def put(self, key: str, response: str) -> None:
+        """
+        Store a response for a prompt.
+
+        Args:
+            key (str): Prompt or user input the response was generated for
+            response (str): Response text to cache
+        """
+        self._insert(key, self._embed(key), response)
+
+    def get_or_compute(self, key: str, compute: Callable[[], str]) -> str:
+        """
+        Return a cached response, or compute and cache a new one.
+
+        Args:
+            key (str): Prompt or user input the response is generated for
+            compute (Callable[[], str]): Produces the response on a cache miss
+
+        Returns:
+            str: Cached or freshly computed response
+        """
+        vector = None if key in self._slots else self._embed(key)
+        cached = self._lookup(key, vector)
+        if cached is not None:
+            return cached
+        response = compute()
+        self._insert(key, vector, response)
+        return response
+
+    async def aget_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[str]]
+    ) -> str:
+        """
+        Return a cached response, or await and cache a new one.
+
+        The prompt is embedded in a worker thread so the event loop stays free.
+
+        Args:
+            key (str): Prompt or user input the response is generated for
+            compute (Callable[[], Awaitable[str]]): Produces the response on a
+                cache miss
+
+        Returns:
+            str: Cached or freshly computed response
+        """
+        vector = (
+            None if key in self._slots else await asyncio.to_thread(self._embed, key)
+        )
+        cached = self._lookup(key, vector)
+        if cached is not None:
+            return cached
+        response = await compute()
+        self._insert(key, vector, response)
+        return response
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._slots.clear()
+        self._embeddings = None
+
+    def save(self, directory: Path) -> None:
+        """
+        Persist the cache to ``<directory>/<namespace>.npz``.
+
+        Embeddings are only written if any were computed, so exact caches and
+        caches without an embedding model are saved too.
+
+        Args:
+            directory (Path): Directory to write the cache file to
+        """
+        if not self._slots:
+            return
+        rows = list(self._slots.values())
+        arrays = {
+            "keys": np.array([self._keys[row] for row in rows]),
+            "responses": np.array([self._responses[row] for row in rows]),
+        }
+        if self._embeddings is not None:
+            arrays["embeddings"] = self._embeddings[rows]
+        directory.mkdir(parents=True, exist_ok=True)
+        np.savez(directory / f"{self.namespace}.npz", **arrays)
+        self.logger.debug("cache_saved", size=len(rows))
+
+    def load(self, directory: Path) -> None:
+        """
+        Restore the cache from ``<directory>/<namespace>.npz`` if it exists.
+
+        Args:
+            directory (Path): Directory to read the cache file from
+        """
+        path = directory / f"{self.namespace}.npz"
+        if not path.exists():
+            return
+        with np.load(path) as data:
+            keys = data["keys"]
+            embeddings = (
+                data["embeddings"] if "embeddings" in data.files else [None] * len(keys)
+            )
+            for vector, key, response in zip(
+                embeddings, keys, data["responses"], strict=True
+            ):
+                self._insert(str(key), vector, str(response))
+        self.logger.debug("cache_loaded", size=len(self._slots))
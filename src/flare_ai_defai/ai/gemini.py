@@ -6,6 +6,7 @@ with Google's Generative AI service. It handles chat sessions, content generatio
 and message management while maintaining a consistent AI personality.
 """
 
+from collections.abc import Iterator
 from typing import Any, override
 
 import google.generativeai as genai
@@ -169,3 +170,20 @@ class GeminiProvider(BaseAIProvider):
                 "prompt_feedback": response.prompt_feedback,
             },
         )
+
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Generate content using the Gemini model, yielding it as it is produced.
+
+        Like generate, this does not use or update the chat session.
+
+        Args:
+            prompt (str): Input prompt for content generation
+
+        Yields:
+            str: Chunks of the generated response text
+        """
+        response = self.model.generate_content(prompt, stream=True)
+        for chunk in response:
+            yield chunk.text
+        self.logger.debug("generate_stream", prompt=prompt, response_text=response.text)
@@ -11,29 +11,227 @@ The module provides a ChatRouter class that integrates various services:
 - Prompt management through PromptService
 """
 
-import json
+import functools
 import re
+import secrets
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from contextvars import ContextVar
+from pathlib import Path
+from types import MappingProxyType
+from typing import Annotated, Any, ClassVar
 
 import structlog
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Cookie, HTTPException, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from web3 import Web3
-from web3.exceptions import Web3RPCError, ContractLogicError
+from web3.contract import Contract
+from web3.contract.contract import ContractFunction
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError, Web3RPCError
 
 from datetime import datetime, timedelta
 import asyncio
-import aiohttp
+import eth_abi
+import httpx
+import numpy as np
+import orjson
 
 
-from flare_ai_defai.ai import GeminiProvider
+from flare_ai_defai.ai import GeminiProvider, ModelResponse, SemanticCache
 from flare_ai_defai.attestation import Vtpm, VtpmAttestationError
 from flare_ai_defai.blockchain import FlareProvider
+from flare_ai_defai.blockchain.abi import FTSOV2_ABI, MULTICALL3_ABI
 from flare_ai_defai.prompts import PromptService, SemanticRouterResponse
-from flare_ai_defai.settings import settings
+from flare_ai_defai.settings import Settings, get_settings
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+# Patterns used to parse token send and swap requests
+_AMOUNT_RE = re.compile(r"\d+(?:\.\d+)?")
+_ADDR_RE = re.compile(r"0x[0-9a-fA-F]{40}\b")
+# Address or amount, so a send request is parsed in one scan; the address
+# alternative comes first so digits inside an address are never read as an amount
+_SEND_RE = re.compile(r"(?P<addr>0x[0-9a-fA-F]{40})\b|(?P<amt>\d+(?:\.\d+)?)")
+
+# Tokens that can be swapped, add more supported tokens as needed
+SWAP_TOKENS = ("FLR", "USDC", "JOULE", "WFLR", "USDT", "WETH")
+_SWAP_TOKEN_SET = frozenset(SWAP_TOKENS)
+
+
+def _normalize_symbol(token: str) -> str:
+    """Normalize a token name for lookup, e.g. 'btc/usd ' -> 'BTC'."""
+    return token.upper().replace("/USD", "").strip()
+
+
+# Token name variations mapped to their interned FTSO symbol, keyed by normalized
+# name. Read-only: callers must not try to mutate it.
+FTSO_SYMBOLS_NORMALIZED = MappingProxyType(
+    {
+        _normalize_symbol(name): symbol
+        for name, symbol in Settings.FTSO_SYMBOLS.items()
+    }
+)
+
+
+def resolve_symbol(token: str) -> str | None:
+    """
+    Resolve a token name such as 'bitcoin' or 'BTC/USD' to its FTSO symbol.
+
+    Returns:
+        str | None: FTSO symbol, or None if the token is not known
+    """
+    return FTSO_SYMBOLS_NORMALIZED.get(_normalize_symbol(token))
+
+
+# Supported token variations, listed when a price request cannot be served
+SUPPORTED_VARIATIONS_STR = ", ".join(
+    sorted(
+        {
+            name
+            for name, symbol in Settings.FTSO_SYMBOLS.items()
+            if symbol in Settings.FTSO_SUPPORTED_TOKENS
+        }
+    )
+)
+
+# Prompt templates whose responses are served through a semantic cache
+CACHE_NAMESPACES = ("semantic_router", "coin_info")
+# Namespaces answered for exact repeats only: extracted entities such as the
+# ticker in "price of BTC" must not be served for "price of ETH"
+EXACT_CACHE_NAMESPACES = frozenset({"coin_info"})
+
+# Number of normalized messages whose route is remembered exactly
+ROUTE_LRU_SIZE = 1024
+
+# Seconds a current FTSO feed value is reused before it is read again
+PRICE_CACHE_TTL = 30.0
+
+# Powers of ten by FTSO feed decimals, covering every int8 decimals value
+_POW10 = tuple(10**i for i in range(129))
+_POW10_F64 = np.array(_POW10, dtype=np.float64)
+
+# Price change arrows, indexed by whether the change is non-negative
+_ARROWS: tuple[str, str] = ("📉", "📈")
+
+# Market watch row for one token, and the text closing the overview
+_format_row = "{0}: ${1:.4f} {2} {3:+.2f}%".format
+_FOOTER_TEXT = (
+    "\n\nThese are the tokens with the most significant price movements in the "
+    "last 5 days.\n"
+    "All price data is sourced from the Flare Time Series Oracle (FTSO) for "
+    "accurate, decentralized market information.\n"
+    "Use the coin info command for detailed price charts of specific tokens."
+)
+
+# Number of context entries kept per session, and the word budget of the
+# context sent along with a conversation message
+CONTEXT_MAX_ENTRIES = 32
+CONTEXT_WORD_BUDGET = 2048
+# Number of sessions whose context is kept, least recently active dropped first
+MAX_SESSIONS = 1024
+SESSION_COOKIE = "session_id"
+
+# Session of the request being handled, set by the chat endpoints
+_session_id: ContextVar[str] = ContextVar("session_id", default="default")
+
+
+def _parse_swap(message: str) -> tuple[float, str, str] | None:
+    """
+    Parse a swap request such as 'Swap 1.5 FLR for USDC' in a single pass.
+
+    The first number is the amount, and the next two all-uppercase words are the
+    source and target tokens; anything in between (e.g. 'for', 'to') is skipped.
+
+    Returns:
+        tuple[float, str, str] | None: Amount, source token and target token, or
+            None if the message does not contain all three
+    """
+    amount: float | None = None
+    tokens: list[str] = []
+    for raw_word in message.split():
+        word = raw_word.strip(".,;:!?'\"")
+        if amount is None:
+            if _AMOUNT_RE.fullmatch(word):
+                amount = float(word)
+        elif word.isalpha() and word.isupper():
+            tokens.append(word)
+            if len(tokens) == 2:
+                return amount, tokens[0], tokens[1]
+    return None
+
+
+def _parse_send(message: str) -> tuple[float | None, str | None]:
+    """
+    Parse a send request such as 'Send 1.5 FLR to 0x...' in a single pass.
+
+    Returns:
+        tuple[float | None, str | None]: First amount and first recipient address
+            in the message, each None if not found
+    """
+    amount: float | None = None
+    address: str | None = None
+    for match in _SEND_RE.finditer(message):
+        if match["addr"]:
+            address = address or match["addr"]
+        elif amount is None:
+            amount = float(match["amt"])
+        if amount is not None and address is not None:
+            break
+    return amount, address
+
+
+def _keyword_route(message: str) -> SemanticRouterResponse | None:
+    """
+    Route unambiguous requests by their leading keyword, without asking the model.
+
+    Only messages that also carry everything their handler needs are matched, e.g.
+    a 'send' request must contain a recipient address.
+    """
+    lowered = message.lstrip().lower()
+    if lowered.startswith("swap") and _parse_swap(message):
+        return SemanticRouterResponse.SWAP_TOKEN
+    if lowered.startswith("send") and _ADDR_RE.search(message):
+        return SemanticRouterResponse.SEND_TOKEN
+    if lowered.startswith("price of"):
+        return SemanticRouterResponse.COIN_INFO
+    return None
+
+
+@functools.cache
+def get_ftso_contract(w3: Web3) -> Contract:
+    """
+    Get the FTSOv2 contract, parsing its ABI once per Web3 instance.
+
+    Args:
+        w3: Web3 instance connected to the Flare network
+
+    Returns:
+        Contract: FTSOv2 contract at the configured address
+    """
+    return w3.eth.contract(address=Settings.FTSOV2_ADDRESS, abi=FTSOV2_ABI)
+
+
+@functools.cache
+def get_multicall_contract(w3: Web3) -> Contract:
+    """
+    Get the Multicall3 contract, parsing its ABI once per Web3 instance.
+
+    Args:
+        w3: Web3 instance connected to the Flare network
+
+    Returns:
+        Contract: Multicall3 contract at the configured address
+    """
+    return w3.eth.contract(address=Settings.MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+
+
+def _decode_feed_id(feed_id: str) -> bytes:
+    """Decode a hex feed ID returned by the DA Layer, e.g. '0x01ab..'."""
+    return bytes.fromhex(feed_id.removeprefix("0x"))
+
 
 class ChatMessage(BaseModel):
     """
@@ -59,9 +257,33 @@ class ChatRouter:
         blockchain (FlareProvider): Provider for blockchain operations
         attestation (Vtpm): Provider for attestation services
         prompts (PromptService): Service for managing prompts
+        caches (dict[str, SemanticCache]): Semantic response caches by prompt name
+        context (str): Recent conversation context of the current session, bounded
+            to CONTEXT_MAX_ENTRIES
         logger (BoundLogger): Structured logger for the chat router
     """
 
+    # Slash commands mapped to the name of the method handling them
+    _COMMANDS: ClassVar[dict[str, str]] = {"/reset": "_cmd_reset"}
+
+    __slots__ = (
+        "_ftsov2",
+        "_http",
+        "_multicall",
+        "_multicall_available",
+        "_price_cache",
+        "_route_exact",
+        "_router",
+        "_sessions",
+        "ai",
+        "attestation",
+        "blockchain",
+        "caches",
+        "flare_api_base",
+        "logger",
+        "prompts",
+    )
+
     def __init__(
         self,
         ai: GeminiProvider,
@@ -81,16 +303,46 @@ class ChatRouter:
         self._router = APIRouter()
         self.ai = ai
         self.blockchain = blockchain
+        # Contract objects are reused by every price request
+        self._ftsov2 = get_ftso_contract(blockchain.w3)
+        self._multicall = get_multicall_contract(blockchain.w3)
+        # Cleared when the configured Multicall3 address turns out to be unusable
+        self._multicall_available = True
+        # Recently read feed values and when they were read, keyed by feed ID
+        self._price_cache: dict[bytes, tuple[tuple[int, int, int], float]] = {}
         self.attestation = attestation
         self.prompts = prompts
         self.logger = logger.bind(router="chat")
+        settings = get_settings()
+        self.caches = {
+            namespace: SemanticCache(
+                namespace,
+                threshold=settings.semantic_cache_threshold,
+                max_size=settings.semantic_cache_size,
+                exact=namespace in EXACT_CACHE_NAMESPACES,
+            )
+            for namespace in CACHE_NAMESPACES
+        }
+        self._route_exact: OrderedDict[str, SemanticRouterResponse] = OrderedDict()
+        if settings.semantic_cache_dir:
+            for cache in self.caches.values():
+                cache.load(Path(settings.semantic_cache_dir))
+            self._router.add_event_handler("shutdown", self.save_caches)
+        self._router.add_event_handler("startup", self.warm_caches)
         self._setup_routes()
 
         self.flare_api_base = "https://flr-data-availability.flare.network/api/v0"
 
-        self.session = None
+        # Long-lived client so connections to the DA layer are pooled and multiplexed
+        self._http = httpx.AsyncClient(
+            base_url=self.flare_api_base,
+            http2=True,
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+        self._router.add_event_handler("shutdown", self.aclose)
 
-        self.context = ""
+        self._sessions: OrderedDict[str, deque[str]] = OrderedDict()
 
     def _setup_routes(self) -> None:
         """
@@ -98,72 +350,231 @@ class ChatRouter:
         Handles message routing, command processing, and transaction confirmations.
         """
 
-        @self._router.post("/")
-        async def chat(message: ChatMessage) -> dict[str, str]:  # pyright: ignore [reportUnusedFunction]
+        @self._router.post("/", response_model=dict[str, str])
+        async def chat(
+            message: ChatMessage,
+            session_id: Annotated[str | None, Cookie()] = None,
+        ) -> ORJSONResponse:
             """
             Process incoming chat messages and route them to appropriate handlers.
 
+            The result is returned as a ready-made ORJSONResponse, so FastAPI does
+            not validate and re-encode the already serializable handler output.
+
             Args:
                 message: Validated chat message
+                session_id: Session cookie, a new session is started if missing
 
             Returns:
-                dict[str, str]: Response containing handled message result
+                ORJSONResponse: Response containing handled message result
 
             Raises:
                 HTTPException: If message handling fails
             """
-            try:
-                self.logger.debug("received_message", message=message.message)
-
-                if message.message.startswith("/"):
-                    return await self.handle_command(message.message)
-                if (
-                    self.blockchain.tx_queue
-                    and message.message == self.blockchain.tx_queue[-1].msg
-                ):
-                    try:
-                        tx_hash = self.blockchain.send_tx_in_queue()
-                    except Web3RPCError as e:
-                        self.logger.exception("send_tx_failed", error=str(e))
-                        msg = (
-                            f"Unfortunately the tx failed with the error:\n{e.args[0]}"
-                        )
-                        return {"response": msg}
-
-                    prompt, mime_type, schema = self.prompts.get_formatted_prompt(
-                        "tx_confirmation",
-                        tx_hash=tx_hash,
-                        block_explorer=settings.web3_explorer_url,
-                    )
-                    tx_confirmation_response = self.ai.generate(
-                        prompt=prompt,
-                        response_mime_type=mime_type,
-                        response_schema=schema,
-                    )
-                    return {"response": tx_confirmation_response.text}
-                if self.attestation.attestation_requested:
-                    try:
-                        resp = self.attestation.get_token([message.message])
-                    except VtpmAttestationError as e:
-                        resp = f"The attestation failed with  error:\n{e.args[0]}"
-                    self.attestation.attestation_requested = False
-                    return {"response": resp}
+            session_id = self._start_session(session_id)
+            result = await self.handle_message(message.message)
+            return self._json_response(result, session_id)
+
+        @self._router.post("/stream", response_model=None)
+        async def chat_stream(
+            message: ChatMessage,
+            session_id: Annotated[str | None, Cookie()] = None,
+        ) -> StreamingResponse | ORJSONResponse:
+            """
+            Process a chat message, streaming conversational replies as they arrive.
 
-                self.context += message.message + "\n"
+            Conversational replies are sent as server-sent events, each carrying a
+            JSON encoded chunk of text. Commands, transaction confirmations,
+            attestations and every other route return the same JSON response as
+            the chat endpoint, since they are not generated token by token.
 
-                route = await self.get_semantic_route(message.message)
-                return await self.route_message(route, message.message)
+            Args:
+                message: Validated chat message
+                session_id: Session cookie, a new session is started if missing
+
+            Returns:
+                StreamingResponse | ORJSONResponse: Event stream of the reply, or
+                    the handler result for non-conversational messages
 
+            Raises:
+                HTTPException: If message handling fails
+            """
+            session_id = self._start_session(session_id)
+            if self._is_transactional(message.message):
+                result = await self.handle_message(message.message)
+                return self._json_response(result, session_id)
+            try:
+                self._context.append(message.message)
+                route = await self.get_semantic_route(message.message)
+                if route != SemanticRouterResponse.CONVERSATIONAL:
+                    result = await self.route_message(route, message.message)
+                    return self._json_response(result, session_id)
             except Exception as e:
-                self.logger.exception("message_handling_failed", error=str(e))
-                raise HTTPException(status_code=500, detail=str(e)) from e
+                msg = str(e)
+                self.logger.exception("message_handling_failed", error=msg)
+                raise HTTPException(status_code=500, detail=msg) from e
+            stream = StreamingResponse(
+                self.stream_conversation(self._context),
+                media_type="text/event-stream",
+            )
+            self._set_session_cookie(stream, session_id)
+            return stream
 
     @property
     def router(self) -> APIRouter:
         """Get the FastAPI router with registered routes."""
         return self._router
 
-    async def handle_command(self, command: str) -> dict[str, str]:
+    @property
+    def _context(self) -> deque[str]:
+        """Get the context entries of the session being handled."""
+        session_id = _session_id.get()
+        context = self._sessions.get(session_id)
+        if context is None:
+            context = self._sessions[session_id] = deque(maxlen=CONTEXT_MAX_ENTRIES)
+            if len(self._sessions) > MAX_SESSIONS:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_id)
+        return context
+
+    @property
+    def context(self) -> str:
+        """Get the recent conversation context of the current session."""
+        return "\n".join(self._context)
+
+    @staticmethod
+    def _start_session(session_id: str | None) -> str:
+        """Bind the request to its session, starting a new session if needed."""
+        if not session_id:
+            session_id = secrets.token_urlsafe(16)
+        _session_id.set(session_id)
+        return session_id
+
+    def _json_response(self, result: dict[str, str], session_id: str) -> ORJSONResponse:
+        """Encode a handler result with orjson and attach the session cookie."""
+        response = ORJSONResponse(result)
+        self._set_session_cookie(response, session_id)
+        return response
+
+    @staticmethod
+    def _set_session_cookie(response: Response, session_id: str) -> None:
+        """Set the session cookie on a response."""
+        response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite="lax")
+
+    @staticmethod
+    def _prompt_context(context: deque[str]) -> str:
+        """Join the newest context entries that fit in CONTEXT_WORD_BUDGET."""
+        entries: list[str] = []
+        words = 0
+        for entry in reversed(context):
+            words += len(entry.split())
+            # The newest entry is the message being answered, so it is always kept
+            if words > CONTEXT_WORD_BUDGET and entries:
+                break
+            entries.append(entry)
+        return "\n".join(reversed(entries))
+
+    def _is_transactional(self, message: str) -> bool:
+        """Check whether a message is a command or answers a pending confirmation."""
+        return (
+            message.startswith("/")
+            or bool(
+                self.blockchain.tx_queue
+                and self.blockchain.tx_queue[-1].matches(message)
+            )
+            or self.attestation.attestation_requested
+        )
+
+    async def aclose(self) -> None:
+        """Close the HTTP client used for Flare data availability requests."""
+        await self._http.aclose()
+
+    async def _ai_generate(self, **kwargs: Any) -> ModelResponse:
+        """Run ``ai.generate`` in a worker thread so the event loop stays free."""
+        return await asyncio.to_thread(self.ai.generate, **kwargs)
+
+    async def warm_caches(self) -> None:
+        """Load the embedding model in a worker thread before the first request."""
+        await asyncio.gather(
+            *(asyncio.to_thread(cache.warm_up) for cache in self.caches.values())
+        )
+
+    def save_caches(self) -> None:
+        """Persist the semantic caches to the configured cache directory."""
+        directory = Path(get_settings().semantic_cache_dir)
+        for cache in self.caches.values():
+            cache.save(directory)
+
+    async def handle_message(self, message: str) -> dict[str, str]:
+        """
+        Handle a chat message: commands, pending confirmations, then routing.
+
+        Args:
+            message: Chat message to handle
+
+        Returns:
+            dict[str, str]: Response containing handled message result
+
+        Raises:
+            HTTPException: If message handling fails
+        """
+        try:
+            self.logger.debug("received_message", message=message)
+
+            if message.startswith("/"):
+                return self.handle_command(message)
+            if (
+                self.blockchain.tx_queue
+                and self.blockchain.tx_queue[-1].matches(message)
+            ):
+                # Claim the transaction before leaving the event loop, so a second
+                # confirmation arriving while it is sent cannot send it again
+                queued = self.blockchain.tx_queue.pop()
+                try:
+                    tx_hash = await asyncio.to_thread(
+                        self.blockchain.sign_and_send_transaction, queued.tx
+                    )
+                except Web3RPCError as e:
+                    self.blockchain.tx_queue.append(queued)
+                    self.logger.exception("send_tx_failed", error=str(e))
+                    msg = f"Unfortunately the tx failed with the error:\n{e.args[0]}"
+                    return {"response": msg}
+                except Exception:
+                    self.blockchain.tx_queue.append(queued)
+                    raise
+                self.logger.debug("sent_tx_hash", tx_hash=tx_hash)
+
+                prompt, mime_type, schema = self.prompts.get_formatted_prompt(
+                    "tx_confirmation",
+                    tx_hash=tx_hash,
+                    block_explorer=get_settings().web3_explorer_url,
+                )
+                tx_confirmation_response = await self._ai_generate(
+                    prompt=prompt,
+                    response_mime_type=mime_type,
+                    response_schema=schema,
+                )
+                return {"response": tx_confirmation_response.text}
+            if self.attestation.attestation_requested:
+                try:
+                    resp = self.attestation.get_token([message])
+                except VtpmAttestationError as e:
+                    resp = f"The attestation failed with  error:\n{e.args[0]}"
+                self.attestation.attestation_requested = False
+                return {"response": resp}
+
+            self._context.append(message)
+
+            route = await self.get_semantic_route(message)
+            return await self.route_message(route, message)
+
+        except Exception as e:
+            msg = str(e)
+            self.logger.exception("message_handling_failed", error=msg)
+            raise HTTPException(status_code=500, detail=msg) from e
+
+    def handle_command(self, command: str) -> dict[str, str]:
         """
         Handle special command messages starting with '/'.
 
@@ -173,33 +584,66 @@ class ChatRouter:
         Returns:
             dict[str, str]: Response containing command result
         """
-        if command == "/reset":
-            self.blockchain.reset()
-            self.ai.reset()
-            return {"response": "Reset complete"}
-        return {"response": "Unknown command"}
+        method = self._COMMANDS.get(command)
+        if not method:
+            return {"response": "Unknown command"}
+        return getattr(self, method)()
+
+    def _cmd_reset(self) -> dict[str, str]:
+        """Reset the wallet, the AI conversation and the session context."""
+        self.blockchain.reset()
+        self.ai.reset()
+        self._context.clear()
+        return {"response": "Reset complete"}
 
     async def get_semantic_route(self, message: str) -> SemanticRouterResponse:
         """
         Determine the semantic route for a message using AI provider.
 
+        Messages seen before are answered from an exact-match LRU, unambiguous
+        requests are routed by keyword, and near-duplicates are served by the
+        semantic cache before falling back to the AI provider.
+
         Args:
             message: Message to route
 
         Returns:
             SemanticRouterResponse: Determined route for the message
         """
-        try:
-            prompt, mime_type, schema = self.prompts.get_formatted_prompt(
-                "semantic_router", user_input=message
-            )
-            route_response = self.ai.generate(
-                prompt=prompt, response_mime_type=mime_type, response_schema=schema
-            )
-            return SemanticRouterResponse(route_response.text)
-        except Exception as e:
-            self.logger.exception("routing_failed", error=str(e))
-            return SemanticRouterResponse.CONVERSATIONAL
+        key = message.strip().lower()[:256]
+        route = self._route_exact.get(key)
+        if route is not None:
+            self._route_exact.move_to_end(key)
+            return route
+
+        route = _keyword_route(message)
+        if route is None:
+            try:
+                prompt, mime_type, schema = self.prompts.get_formatted_prompt(
+                    "semantic_router", user_input=message
+                )
+
+                async def generate_route() -> str:
+                    response = await self._ai_generate(
+                        prompt=prompt,
+                        response_mime_type=mime_type,
+                        response_schema=schema,
+                    )
+                    # Raises on an unknown route, so invalid output is never cached
+                    return SemanticRouterResponse(response.text).value
+
+                route_text = await self.caches["semantic_router"].aget_or_compute(
+                    message, generate_route
+                )
+                route = SemanticRouterResponse(route_text)
+            except Exception as e:
+                self.logger.exception("routing_failed", error=str(e))
+                return SemanticRouterResponse.CONVERSATIONAL
+
+        self._route_exact[key] = route
+        if len(self._route_exact) > ROUTE_LRU_SIZE:
+            self._route_exact.popitem(last=False)
+        return route
 
     async def route_message(
         self, route: SemanticRouterResponse, message: str
@@ -247,10 +691,10 @@ class ChatRouter:
         prompt, mime_type, schema = self.prompts.get_formatted_prompt(
             "generate_account", address=address
         )
-        gen_address_response = self.ai.generate(
+        gen_address_response = await self._ai_generate(
             prompt=prompt, response_mime_type=mime_type, response_schema=schema
         )
-        self.context += gen_address_response.text + "\n"
+        self._context.append(gen_address_response.text)
         return {"response": gen_address_response.text}
 
     async def handle_send_token(self, message: str) -> dict[str, str]:
@@ -266,20 +710,14 @@ class ChatRouter:
         if not self.blockchain.address:
             await self.handle_generate_account(message)
 
-        # Extract the first number in the message for amount
-        amount_match = re.search(r'\d+(?:\.\d+)?', message)
-        if not amount_match:
+        # First number is the amount, recipient is 0x followed by 40 hex chars
+        amount, to_address = _parse_send(message)
+        if amount is None:
             raise ValueError("No valid amount found in message")
-        
-        # Find Ethereum address (0x followed by 40 hex chars)
-        address_match = re.search(r'0x[0-9a-fA-F]{40}\b', message)
-        if not address_match:
+        if to_address is None:
             raise ValueError("No valid Ethereum address found in message")
-        
-        send_token_json = {
-            "to_address": address_match.group(),
-            "amount": float(amount_match.group()),
-        }
+
+        send_token_json = {"to_address": to_address, "amount": amount}
         # send_token_response = self.ai.generate(
         #     prompt=prompt, response_mime_type=mime_type, response_schema=schema
         # )
@@ -291,10 +729,11 @@ class ChatRouter:
             or send_token_json.get("amount") == 0.0
         ):
             prompt, _, _ = self.prompts.get_formatted_prompt("follow_up_token_send")
-            follow_up_response = self.ai.generate(prompt)
+            follow_up_response = await self._ai_generate(prompt=prompt)
             return {"response": follow_up_response.text}
 
-        tx = self.blockchain.create_send_flr_tx(
+        tx = await asyncio.to_thread(
+            self.blockchain.create_send_flr_tx,
             to_address=send_token_json.get("to_address"),
             amount=send_token_json.get("amount"),
         )
@@ -305,7 +744,7 @@ class ChatRouter:
             + f"Sending {Web3.from_wei(tx.get('value', 0), 'ether')} "
             + f"FLR to {tx.get('to')}\nType CONFIRM to proceed."
         )
-        self.context += formatted_preview + "\n"
+        self._context.append(formatted_preview)
         return {"response": formatted_preview}
 
     async def handle_swap_token(self, message: str) -> dict[str, str]:
@@ -323,27 +762,26 @@ class ChatRouter:
         if not self.blockchain.address:
             await self.handle_generate_account(message)
 
-        # Extract amount and tokens using regex
-        swap_pattern = r"^.*?(\d+)\s+([A-Z]+).*?([A-Z]+).*"
-        match = re.search(swap_pattern, message)
+        # Extract amount and tokens
+        parsed = _parse_swap(message)
         
-        if not match:
+        if not parsed:
             return {"response": "Invalid swap format. Please use: 'Swap X TokenA for TokenB case sensitive'"}
             
-        from_amount = float(match.group(1))
-        from_token = match.group(2).upper()
-        to_token = match.group(3).upper()
+        from_amount, from_token, to_token = parsed
         
         # Validate tokens are supported
-        supported_tokens = ["FLR", "USDC", "JOULE", "WFLR", "USDT", "WETH"]  # Add more supported tokens as needed
-        if from_token not in supported_tokens or to_token not in supported_tokens:
+        if from_token not in _SWAP_TOKEN_SET or to_token not in _SWAP_TOKEN_SET:
             return {
-                "response": f"Unsupported tokens. Currently supported tokens: {', '.join(supported_tokens)}"
+                "response": "Unsupported tokens. Currently supported tokens: "
+                f"{', '.join(SWAP_TOKENS)}"
             }
             
 
         # Create swap transaction
-        swap_tx = self.blockchain.handle_swap_token(
+        # Waits for the wrap/approval and swap receipts, so keep it off the loop
+        swap_tx = await asyncio.to_thread(
+            self.blockchain.handle_swap_token,
             from_token=from_token,
             to_token=to_token,
             amount=from_amount
@@ -365,7 +803,7 @@ class ChatRouter:
             f"{swap_tx[10:]}"
             # f"Type CONFIRM SWAP to proceed."
         )
-        self.context += formatted_preview + "\n"
+        self._context.append(formatted_preview)
         
         return {"response": formatted_preview}
 
@@ -380,27 +818,58 @@ class ChatRouter:
             dict[str, str]: Response containing attestation request
         """
         prompt = self.prompts.get_formatted_prompt("request_attestation")[0]
-        request_attestation_response = self.ai.generate(prompt=prompt)
+        request_attestation_response = await self._ai_generate(prompt=prompt)
         self.attestation.attestation_requested = True
 
-        self.context += request_attestation_response.text + "\n"
+        self._context.append(request_attestation_response.text)
 
         return {"response": request_attestation_response.text}
 
-    async def handle_conversation(self, message: str) -> dict[str, str]:
+    async def handle_conversation(self, _: str) -> dict[str, str]:
         """
         Handle general conversation messages.
 
+        The reply is generated statelessly from the session context, so sessions
+        never see each other's turns and the prompt stays within the word budget.
+
         Args:
-            message: Message to process
+            _: Unused, the message is the newest entry of the session context
 
         Returns:
             dict[str, str]: Response from AI provider
         """
-        response = self.ai.send_message(self.context + "\n" + message)
-        self.context += response.text + "\n"
+        response = await self._ai_generate(prompt=self._prompt_context(self._context))
+        self._context.append(response.text)
         return {"response": response.text}
 
+    async def stream_conversation(
+        self, session_context: deque[str]
+    ) -> AsyncIterator[str]:
+        """
+        Stream a conversational reply as server-sent events.
+
+        Args:
+            session_context: Context entries of the session the message belongs to,
+                ending with the message to reply to
+
+        Yields:
+            str: Events with a JSON encoded text chunk, terminated by a done event
+        """
+        chunks = self.ai.generate_stream(self._prompt_context(session_context))
+        parts: list[str] = []
+        try:
+            # Each chunk blocks on the network, so pull them from a worker thread
+            while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                parts.append(chunk)
+                yield f"data: {orjson.dumps(chunk).decode()}\n\n"
+        except Exception as e:
+            msg = str(e)
+            self.logger.exception("stream_failed", error=msg)
+            yield f"event: error\ndata: {orjson.dumps(msg).decode()}\n\n"
+            return
+        session_context.append("".join(parts))
+        yield "event: done\ndata: {}\n\n"
+
     def create_ascii_chart(self, prices: list[float], max_width: int = 20, max_height: int = 10) -> list[str]:
 
         """Create an ASCII scatter plot from a list of prices."""
@@ -409,73 +878,37 @@ class ChatRouter:
 
             return []
 
-            
+        # Reverse to show oldest to newest (left to right)
+        prices_arr = np.asarray(prices, dtype=np.float64)[::-1]
 
         # Calculate price range with dynamic padding based on volatility
-
-        min_price = min(prices)
-
-        max_price = max(prices)
-
+        min_price = float(prices_arr.min())
+        max_price = float(prices_arr.max())
         price_range = max_price - min_price
 
-        
-
         # Use more padding (up to 15%) for low volatility to make changes more visible
-
         padding_percent = min(0.15, max(0.05, 1 - (price_range / max_price)))
-
         padding = price_range * padding_percent
 
-        
-
         min_price = min_price - padding
-
         max_price = max_price + padding
-
         price_range = max_price - min_price if max_price != min_price else 1
 
-        
-
-        # Initialize the chart grid with spaces
-
-        grid = [[" " for _ in range(max_width)] for _ in range(max_height)]
-
-        
-
-        # Add y-axis line
-
-        for i in range(max_height):
-
-            grid[i][0] = "│"
-
-            
-
-        # Add x-axis line
-
-        for i in range(max_width):
-
-            grid[max_height-1][i] = "─"
-
-            
-
-        # Add corner
-
-        grid[max_height-1][0] = "└"
-
-        
-
-        # Plot data points
-
-        for i, price in enumerate(reversed(prices)):  # Reverse to show oldest to newest (left to right)
-
-            x = 1 + int(((i / (len(prices) - 1)) * (max_width - 2)))  # Leave space for y-axis
-
-            y = int(((price - min_price) / price_range) * (max_height - 2))  # Leave space for x-axis
-
-            if 0 <= y < max_height-1 and x < max_width:  # Ensure we don't overwrite axes
-
-                grid[y][x] = "•"
+        # Initialize the chart grid with spaces, the y-axis, the x-axis and the corner
+        grid = np.full((max_height, max_width), " ", dtype="<U1")
+        grid[:, 0] = "│"
+        grid[-1, :] = "─"
+        grid[-1, 0] = "└"
+
+        # Plot all data points in one scatter, leaving space for both axes
+        n = len(prices_arr)
+        xs = 1 + (np.arange(n) / max(n - 1, 1) * (max_width - 2)).astype(np.int64)
+        ys = ((prices_arr - min_price) / price_range * (max_height - 2)).astype(
+            np.int64
+        )
+        # Ensure we don't overwrite axes
+        on_chart = (ys >= 0) & (ys < max_height - 1) & (xs < max_width)
+        grid[ys[on_chart], xs[on_chart]] = "•"
 
         
 
@@ -548,75 +981,114 @@ class ChatRouter:
         chart.append(label_line)
 
         
-        self.context += "\n".join(chart) + "\n"
+        self._context.append("\n".join(chart))
         return chart
 
 
 
-    async def get_historical_prices(self, feed_id: str, latest_round_id: int, latest_timestamp: int) -> list[tuple[float, str, int]]:
+    async def get_historical_prices(
+        self, feed_id: bytes, latest_round_id: int, latest_timestamp: int
+    ) -> list[tuple[float, str, int]]:
 
         """Get historical price data for multiple voting rounds."""
 
-        if not self.session:
-
-            self.session = aiohttp.ClientSession()
-
-            
-
-        rounds_per_day = int((24 * 60 * 60) / 90)  # 90 seconds per round
-
-        historical_data = []
-
-        
+        histories = await self.get_historical_prices_batch(
+            [feed_id], latest_round_id, latest_timestamp
+        )
+        if feed_id not in histories:
+            msg = f"No historical price data available for 0x{feed_id.hex()}"
+            raise ValueError(msg)
+        return histories[feed_id]
+
+    async def get_historical_prices_batch(
+        self, feed_ids: list[bytes], latest_round_id: int, latest_timestamp: int
+    ) -> dict[bytes, list[tuple[float, str, int]]]:
+        """
+        Get historical price data of several feeds for the last five days.
 
-        for days_ago in range(5):
+        Each voting round is requested once for all feeds, and the five rounds are
+        requested concurrently.
 
-            historical_round_id = latest_round_id - (rounds_per_day * (days_ago + 1))
+        Args:
+            feed_ids: FTSO feed IDs
+            latest_round_id: ID of the latest voting round
+            latest_timestamp: Start timestamp of the latest voting round
 
-            payload = {"feed_ids": [feed_id]}
+        Returns:
+            dict[bytes, list[tuple[float, str, int]]]: Price, formatted time and days
+                ago for each feed, oldest last. Feeds missing from any round are
+                omitted.
+        """
+        if not feed_ids:
+            return {}
 
-            url = f"{self.flare_api_base}/ftso/anchor-feeds-with-proof"
+        rounds_per_day = int((24 * 60 * 60) / 90)  # 90 seconds per round
+        # Every round asks for the same feeds, so the request body is encoded once
+        hex_ids = [f"0x{feed_id.hex()}" for feed_id in feed_ids]
+        payload = orjson.dumps({"feed_ids": hex_ids})
 
+        async def fetch_round(days_ago: int) -> tuple[str, list[dict]]:
+            historical_round_id = latest_round_id - (rounds_per_day * days_ago)
             params = {"voting_round_id": historical_round_id}
 
-            
-
-            async with self.session.post(url, params=params, json=payload) as response:
-
-                if response.status != 200:
-
-                    raise HTTPException(status_code=response.status, detail=f"Failed to fetch historical price for {days_ago + 1} days ago")
-
-                data = await response.json()
-
-                if not data:
-
-                    raise ValueError(f"No historical price data available for {days_ago + 1} days ago")
-
-                    
-
-                feed_data = data[0]["body"]
-
-                price = feed_data["value"] / (10 ** abs(feed_data["decimals"]))
-
-                
-
-                # Calculate timestamp based on latest timestamp and rounds difference
-
-                rounds_diff = latest_round_id - historical_round_id
-
-                historical_timestamp = latest_timestamp - (rounds_diff * 90)  # 90 seconds per round
-
-                timestamp = datetime.fromtimestamp(historical_timestamp)
-
-                formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
+            response = await self._http.post(
+                "/ftso/anchor-feeds-with-proof",
+                params=params,
+                content=payload,
+                headers={"Content-Type": "application/json"},
+            )
+            if response.status_code != 200:
+                raise HTTPException(
+                    status_code=response.status_code,
+                    detail=f"Failed to fetch historical price for {days_ago} days ago",
+                )
+            data = orjson.loads(response.content)
+
+            if not data:
+                msg = f"No historical price data available for {days_ago} days ago"
+                raise ValueError(msg)
+
+            # Calculate timestamp based on latest timestamp and rounds difference
+            rounds_diff = latest_round_id - historical_round_id
+            # 90 seconds per round
+            historical_timestamp = latest_timestamp - (rounds_diff * 90)
+            timestamp = datetime.fromtimestamp(historical_timestamp)
+            formatted_time = timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
+            return formatted_time, [entry["body"] for entry in data]
+
+        # The rounds are independent, so request all of them concurrently
+        responses = await asyncio.gather(
+            *(fetch_round(days_ago) for days_ago in range(1, 6))
+        )
 
-                historical_data.append((price, formatted_time, days_ago + 1))
+        # Decode the prices of every round at once with a power-of-ten lookup
+        bodies = [body for _, round_bodies in responses for body in round_bodies]
+        values = np.array([body["value"] for body in bodies], dtype=np.float64)
+        decimals = np.array([body["decimals"] for body in bodies], dtype=np.int64)
+        decoded = iter((values / _POW10_F64[np.abs(decimals)]).tolist())
+        rounds = [
+            (
+                formatted_time,
+                {_decode_feed_id(body["id"]): next(decoded) for body in round_bodies},
+            )
+            for formatted_time, round_bodies in responses
+        ]
 
-        
-        self.context += "\n" + str(historical_data) + "\n"
+        histories = {}
+        for feed_id in feed_ids:
+            if any(feed_id not in prices for _, prices in rounds):
+                self.logger.error(
+                    "Missing historical price data", feed_id=feed_id.hex()
+                )
+                continue
+            historical_data = [
+                (prices[feed_id], formatted_time, days_ago)
+                for days_ago, (formatted_time, prices) in enumerate(rounds, start=1)
+            ]
+            self._context.append(str(historical_data))
+            histories[feed_id] = historical_data
 
-        return historical_data
+        return histories
 
 
 
@@ -650,51 +1122,42 @@ class ChatRouter:
 
             )
 
-            coin_info_response = self.ai.generate(
-
-                prompt=prompt,
-
-                response_mime_type=mime_type,
-
-                response_schema=schema,
-
+            async def generate_coin_info() -> str:
+                response = await self._ai_generate(
+                    prompt=prompt,
+                    response_mime_type=mime_type,
+                    response_schema=schema,
+                )
+                # Raises on malformed output, so it is never cached
+                if not isinstance(orjson.loads(response.text)["token"], str):
+                    msg = f"Invalid coin info response: {response.text}"
+                    raise TypeError(msg)
+                return response.text
+
+            coin_info_response = await self.caches["coin_info"].aget_or_compute(
+                message, generate_coin_info
             )
 
             
 
-            coin_info = json.loads(coin_info_response.text)
+            coin_info = orjson.loads(coin_info_response)
 
             token = coin_info["token"]
 
             
 
-            # Normalize token name (remove /USD, convert to uppercase, strip spaces)
-
-            normalized_token = token.upper().replace("/USD", "").strip()
-
-            
-
             # Get the FTSO symbol
-
-            ftso_symbol = settings.FTSO_SYMBOLS.get(normalized_token)
+            ftso_symbol = resolve_symbol(token)
 
             if not ftso_symbol:
 
-                supported_variations = [
-
-                    k for k, v in settings.FTSO_SYMBOLS.items() 
-
-                    if v in settings.FTSO_SUPPORTED_TOKENS
-
-                ]
-
                 return {
 
                     "response": (
 
                         f"Sorry, I cannot get the price for {token}. "
 
-                        f"Supported tokens are: {', '.join(sorted(set(supported_variations)))}\n"
+                        f"Supported tokens are: {SUPPORTED_VARIATIONS_STR}\n"
 
                         "You can use any common variation of these tokens (e.g., 'BTC' or 'Bitcoin')."
 
@@ -706,7 +1169,7 @@ class ChatRouter:
 
             # Get the feed ID for the token
 
-            feed_id = settings.FTSO_FEED_IDS.get(ftso_symbol)
+            feed_id = Settings.FTSO_FEED_IDS.get(ftso_symbol)
 
             if not feed_id:
 
@@ -728,7 +1191,7 @@ class ChatRouter:
 
                 # Check Web3 connection
 
-                if not self.blockchain.w3.is_connected():
+                if not await asyncio.to_thread(self.blockchain.w3.is_connected):
 
                     return {
 
@@ -740,29 +1203,11 @@ class ChatRouter:
 
                 
 
-                # Get current price from FTSO contract
-
-                ftsov2 = self.blockchain.w3.eth.contract(
-
-                    address=settings.FTSOV2_ADDRESS,
-
-                    abi=settings.FTSOV2_ABI
-
+                # Get current price data from FTSO, shared with market watch
+                (feed,) = await asyncio.to_thread(
+                    self.get_current_feeds, [ftso_symbol]
                 )
-
-                
-
-                # Convert feed ID from hex string to bytes21
-
-                feed_id_bytes = bytes.fromhex(feed_id[2:])  # Remove '0x' prefix
-
-                
-
-                # Get current price data from FTSO
-
-                price, decimals, timestamp = ftsov2.functions.getFeedById(feed_id_bytes).call()
-
-                
+                price, decimals, timestamp = feed or (0, 0, 0)
 
                 if price == 0:
 
@@ -776,7 +1221,7 @@ class ChatRouter:
 
                 # Calculate actual price (price is returned with decimals)
 
-                current_price = price / (10 ** abs(decimals))
+                current_price = price / _POW10[abs(decimals)]
 
                 
 
@@ -808,7 +1253,7 @@ class ChatRouter:
 
                     total_change = -1 * ((current_price - oldest_price) / oldest_price) * 100
 
-                    change_symbol = "📉" if total_change < 0 else "📈"  # Flipped comparison due to flipped sign
+                    change_symbol = _ARROWS[total_change >= 0]
 
                     
 
@@ -859,8 +1304,9 @@ class ChatRouter:
                     ]
 
                 
-                self.context += "\n" + str(response) + "\n"
-                return {"response": "\n".join(response)}
+                body = "\n".join(response)
+                self._context.append(body)
+                return {"response": body}
 
                 
 
@@ -874,7 +1320,7 @@ class ChatRouter:
 
                     symbol=ftso_symbol,
 
-                    feed_id=feed_id,
+                    feed_id=feed_id.hex(),
 
                     original_token=token
 
@@ -898,7 +1344,7 @@ class ChatRouter:
 
                     symbol=ftso_symbol,
 
-                    feed_id=feed_id,
+                    feed_id=feed_id.hex(),
 
                     original_token=token
 
@@ -915,16 +1361,11 @@ class ChatRouter:
                 
 
         except Exception as e:
-
-            self.logger.error("Error processing coin info request", error=str(e))
-
+            msg = str(e)
+            self.logger.error("coin_info_failed", error=msg)
             raise HTTPException(
-
-                status_code=500,
-
-                detail=f"Error processing request: {str(e)}"
-
-            )
+                status_code=500, detail=f"Error processing request: {msg}"
+            ) from e
 
 
 
@@ -932,179 +1373,256 @@ class ChatRouter:
 
         """Get the latest voting round ID and its timestamp."""
 
-        if not self.session:
+        response = await self._http.get("/fsp/latest-voting-round")
 
-            self.session = aiohttp.ClientSession()
+        if response.status_code != 200:
 
-            
-
-        async with self.session.get(f"{self.flare_api_base}/fsp/latest-voting-round") as response:
-
-            if response.status != 200:
-
-                raise HTTPException(status_code=response.status, detail="Failed to fetch latest voting round")
-
-            data = await response.json()
+            raise HTTPException(
+                status_code=response.status_code,
+                detail="Failed to fetch latest voting round",
+            )
 
-            return data["voting_round_id"], data["start_timestamp"]
+        data = orjson.loads(response.content)
 
+        return data["voting_round_id"], data["start_timestamp"]
 
 
-    async def handle_market_watch(self, _: str) -> dict[str, str]:
 
+    def get_current_feeds(self, tokens: list[str]) -> list[tuple[int, int, int] | None]:
         """
+        Get the current values of several FTSO feeds.
 
-        Get market trend analysis for all supported FTSO tokens.
-
-
+        Values read within the last PRICE_CACHE_TTL seconds are served from memory,
+        the rest are read together in one call.
 
         Args:
+            tokens: FTSO symbols of the feeds to read
 
-            _: Unused message parameter
+        Returns:
+            list[tuple[int, int, int] | None]: Value, decimals and timestamp for each
+                feed, or None where the individual call reverted
+        """
+        now = time.monotonic()
+        feeds: dict[str, tuple[int, int, int] | None] = {}
+        for token in tokens:
+            cached = self._price_cache.get(Settings.FTSO_FEED_IDS[token])
+            if cached is not None and now - cached[1] < PRICE_CACHE_TTL:
+                feeds[token] = cached[0]
+
+        missing = [token for token in tokens if token not in feeds]
+        if missing:
+            for token, feed in zip(missing, self._read_feeds(missing), strict=True):
+                feeds[token] = feed
+                if feed is not None:
+                    self._price_cache[Settings.FTSO_FEED_IDS[token]] = (feed, now)
+        return [feeds[token] for token in tokens]
+
+    def _read_feeds(self, tokens: list[str]) -> list[tuple[int, int, int] | None]:
+        """
+        Read the current values of several FTSO feeds with one getFeedsById call.
 
+        getFeedsById reverts as a whole if any of the feeds cannot be read, in
+        which case the feeds are read individually so only the bad ones are lost.
 
+        Args:
+            tokens: FTSO symbols of the feeds to read
 
         Returns:
-
-            dict[str, str]: Response containing market trend analysis
-
+            list[tuple[int, int, int] | None]: Value, decimals and timestamp for each
+                feed, or None where the feed could not be read
         """
-
+        feed_ids = [Settings.FTSO_FEED_IDS[token] for token in tokens]
         try:
+            values, decimals, timestamp = self._ftsov2.functions.getFeedsById(
+                feed_ids
+            ).call()
+        except (BadFunctionCallOutput, ContractLogicError) as e:
+            self.logger.warning("get_feeds_by_id_failed", error=str(e))
+            return self._read_feeds_individually(tokens)
+        return [
+            (value, decimal, timestamp)
+            for value, decimal in zip(values, decimals, strict=True)
+        ]
+
+    def _read_feeds_individually(
+        self, tokens: list[str]
+    ) -> list[tuple[int, int, int] | None]:
+        """
+        Read several FTSO feeds with getFeedById calls aggregated by Multicall3.
 
-            tokens = settings.FTSO_SUPPORTED_TOKENS
-
-            token_data = []
-
-
-
-            latest_round_id, latest_timestamp = await self.get_latest_voting_round()
-
-
-
-            for token in tokens:
-
-                try:
-
-                    feed_id = settings.FTSO_FEED_IDS.get(token)
-
-                    if not feed_id:
-
-                        continue
-
-
-
-                    # Get current price from FTSO contract first
-
-                    feed_id_bytes = bytes.fromhex(feed_id[2:])  # Remove '0x' prefix
-
-                    ftsov2 = self.blockchain.w3.eth.contract(
-
-                        address=settings.FTSOV2_ADDRESS,
-
-                        abi=settings.FTSOV2_ABI
-
-                    )
-
-                    price, decimals, timestamp = ftsov2.functions.getFeedById(feed_id_bytes).call()
-
-                    if price == 0:
+        Falls back to a single JSON-RPC batch of getFeedById calls when Multicall3
+        is not deployed on the connected network.
 
-                        continue
+        Args:
+            tokens: FTSO symbols of the feeds to read
 
-                    
+        Returns:
+            list[tuple[int, int, int] | None]: Value, decimals and timestamp for each
+                feed, or None where the individual call reverted
+        """
+        if not self._multicall_available:
+            return self._get_current_feeds_batched(tokens)
+
+        calls = [
+            (
+                Settings.FTSOV2_ADDRESS,
+                True,  # allowFailure, so one bad feed does not revert the batch
+                self._ftsov2.encode_abi(
+                    "getFeedById", args=[Settings.FTSO_FEED_IDS[token]]
+                ),
+            )
+            for token in tokens
+        ]
+        try:
+            results = self._multicall.functions.aggregate3(calls).call()
+        except (BadFunctionCallOutput, ContractLogicError) as e:
+            self.logger.warning("multicall_unavailable", error=str(e))
+            self._multicall_available = False
+            return self._get_current_feeds_batched(tokens)
+        feeds: list[tuple[int, int, int] | None] = []
+        for success, return_data in results:
+            if not success:
+                feeds.append(None)
+                continue
+            value, decimals, timestamp = eth_abi.decode(
+                ["uint256", "int8", "uint64"], return_data
+            )
+            feeds.append((value, decimals, timestamp))
+        return feeds
 
-                    current_price = price / (10 ** abs(decimals))
 
 
+    def _get_current_feeds_batched(
+        self, tokens: list[str]
+    ) -> list[tuple[int, int, int] | None]:
+        """
+        Read several FTSO feeds with getFeedById calls sent in one JSON-RPC batch.
 
-                    # Get historical prices for comparison
+        A failed call fails the whole batch, so the feeds are then read one call
+        at a time and None is returned for those that still fail.
+        """
+        calls = [
+            self._ftsov2.functions.getFeedById(Settings.FTSO_FEED_IDS[token])
+            for token in tokens
+        ]
+        try:
+            with self.blockchain.w3.batch_requests() as batch:
+                for call in calls:
+                    batch.add(call)
+                results = batch.execute()
+        except (BadFunctionCallOutput, ContractLogicError, Web3RPCError) as e:
+            self.logger.warning("batched_feeds_failed", error=str(e))
+            return [self._call_feed(call) for call in calls]
+        return [
+            (int(value), int(decimals), int(timestamp))
+            for value, decimals, timestamp in results
+        ]
+
+    def _call_feed(self, call: ContractFunction) -> tuple[int, int, int] | None:
+        """Run a single getFeedById call, returning None when it fails."""
+        try:
+            value, decimals, timestamp = call.call()
+        except (BadFunctionCallOutput, ContractLogicError, Web3RPCError) as e:
+            self.logger.warning("get_feed_by_id_failed", error=str(e))
+            return None
+        return int(value), int(decimals), int(timestamp)
 
-                    historical_data = await self.get_historical_prices(feed_id, latest_round_id, latest_timestamp)
 
-                    if not historical_data:
 
-                        continue
+    async def handle_market_watch(self, _: str) -> dict[str, str]:
 
+        """
 
+        Get market trend analysis for all supported FTSO tokens.
 
-                    five_day_price = historical_data[-1][0]  # 5 days ago price
 
-                    price_change = -1 * ((current_price - five_day_price) / five_day_price) * 100
 
+        Args:
 
+            _: Unused message parameter
 
-                    token_data.append({
 
-                        'token': token,
 
-                        'current_price': current_price,
+        Returns:
 
-                        'price_change': price_change
+            dict[str, str]: Response containing market trend analysis
 
-                    })
+        """
 
+        try:
 
+            feeds = [
+                (token, Settings.FTSO_FEED_IDS[token])
+                for token in Settings.FTSO_SUPPORTED_TOKENS
+                if token in Settings.FTSO_FEED_IDS
+            ]
 
-                except Exception as e:
+            latest_round_id, latest_timestamp = await self.get_latest_voting_round()
 
-                    self.logger.error(f"Error processing {token}", error=str(e))
+            # Read the current price of every token in a single RPC round-trip
+            current_feeds = await asyncio.to_thread(
+                self.get_current_feeds, [token for token, _ in feeds]
+            )
 
+            priced_feeds = []
+            for (token, feed_id), feed in zip(feeds, current_feeds, strict=True):
+                if feed is None:
+                    self.logger.error(
+                        "market_watch_feed_failed",
+                        token=token,
+                        error="getFeedById reverted",
+                    )
                     continue
+                price, decimals, _timestamp = feed
+                if price == 0:
+                    continue
+                priced_feeds.append((token, feed_id, price / _POW10[abs(decimals)]))
 
-
-
-            token_data.sort(key=lambda x: abs(x['price_change']), reverse=True)
-
-            top_movers = token_data[:3]  
-
-
+            # Get historical prices for comparison, one request per round for all tokens
+            try:
+                histories = await self.get_historical_prices_batch(
+                    [feed_id for _, feed_id, _ in priced_feeds],
+                    latest_round_id,
+                    latest_timestamp,
+                )
+            except Exception as e:
+                self.logger.error("Failed to fetch historical prices", error=str(e))
+                histories = {}
+
+            # Tokens with a usable price from 5 days ago
+            movers = [
+                (token, current_price, histories[feed_id][-1][0])
+                for token, feed_id, current_price in priced_feeds
+                if histories.get(feed_id) and histories[feed_id][-1][0] != 0
+            ]
+
+            # 5-day change of every token in one vector op (sign flipped as before),
+            # then the three largest absolute moves in their original order on ties
+            current = np.array([price for _, price, _ in movers], dtype=np.float64)
+            five_day = np.array([price for _, _, price in movers], dtype=np.float64)
+            price_changes = -((current - five_day) / five_day * 100)
+            top_movers = np.argsort(-np.abs(price_changes), kind="stable")[:3]
 
             response_lines = ["📊 Market Overview (5-Day Change) via Flare Time Series Oracle", ""]
 
-            
-
-            for data in top_movers:
-
-                change_symbol = "📉" if data['price_change'] < 0 else "📈"  # Flipped comparison due to flipped sign
-
+            for i in top_movers.tolist():
+                token, current_price, _ = movers[i]
+                price_change = float(price_changes[i])
                 response_lines.append(
-
-                    f"{data['token']}: ${data['current_price']:.4f} "
-
-                    f"{change_symbol} {data['price_change']:+.2f}%"
-
+                    _format_row(
+                        token, current_price, _ARROWS[price_change >= 0], price_change
+                    )
                 )
 
-
-
-            response_lines.extend([
-
-                "",
-
-                "These are the tokens with the most significant price movements in the last 5 days.",
-
-                "All price data is sourced from the Flare Time Series Oracle (FTSO) for accurate, decentralized market information.",
-
-                "Use the coin info command for detailed price charts of specific tokens."
-
-            ])
-
-
-            self.context += "\n" + "\n".join(response_lines) + "\n"
-
-            return {"response": "\n".join(response_lines)}
+            body = "\n".join(response_lines) + _FOOTER_TEXT
+            self._context.append(body)
+            return {"response": body}
 
 
 
         except Exception as e:
-
-            self.logger.error("Error in market watch", error=str(e))
-
+            msg = str(e)
+            self.logger.error("market_watch_failed", error=msg)
             raise HTTPException(
-
-                status_code=500,
-
-                detail=f"Error processing market watch request: {str(e)}"
-
-            )
+                status_code=500, detail=f"Error processing market watch request: {msg}"
+            ) from e
@@ -5,7 +5,7 @@ This module provides a FlareProvider class for interacting with the Flare Networ
 It handles account management, transaction queuing, and blockchain interactions.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import os
 from dotenv import load_dotenv
 import structlog
@@ -28,10 +28,19 @@ class TxQueueElement:
     Attributes:
         msg (str): Description or context of the transaction
         tx (TxParams): Transaction parameters
+        msg_hash (int): Hash of msg, compared before the message itself
     """
 
     msg: str
     tx: TxParams
+    msg_hash: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.msg_hash = hash(self.msg)
+
+    def matches(self, msg: str) -> bool:
+        """Check whether a message is the one this transaction was queued for."""
+        return hash(msg) == self.msg_hash and msg == self.msg
 
 
 logger = structlog.get_logger(__name__)
@@ -15,6 +15,7 @@ Dependencies:
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from flare_ai_defai import (
     ChatRouter,
@@ -23,7 +24,7 @@ from flare_ai_defai import (
     PromptService,
     Vtpm,
 )
-from flare_ai_defai.settings import settings
+from flare_ai_defai.settings import get_settings
 
 logger = structlog.get_logger(__name__)
 
@@ -54,8 +55,12 @@ def create_app() -> FastAPI:
         - web3_provider_url: URL for Web3 provider
         - simulate_attestation: Boolean flag for attestation simulation
     """
+    settings = get_settings()
     app = FastAPI(
-        title="AI Agent API", version=settings.api_version, redirect_slashes=False
+        title="AI Agent API",
+        version=settings.api_version,
+        redirect_slashes=False,
+        default_response_class=ORJSONResponse,
     )
 
     # Configure CORS middleware with settings from configuration
@@ -13,6 +13,7 @@ across the application.
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from string import Template
 from typing import TypedDict
 
@@ -160,6 +161,11 @@ class Prompt:
     category: str | None = None
     version: str = "1.0"
 
+    @cached_property
+    def compiled_template(self) -> Template:
+        """The template text parsed once into a string.Template."""
+        return Template(self.template)
+
     def format(self, **kwargs: str | PromptInputs) -> str:
         """
         Format the prompt template with provided input values.
@@ -193,7 +199,7 @@ class Prompt:
             return self.template
 
         try:
-            return Template(self.template).safe_substitute(**kwargs)
+            return self.compiled_template.safe_substitute(**kwargs)
         except KeyError as e:
             missing_keys = set(self.required_inputs) - set(kwargs.keys())
             if missing_keys:
@@ -16,6 +16,7 @@ Example:
     ```
 """
 
+from collections import OrderedDict
 from typing import Any
 
 import structlog
@@ -24,6 +25,13 @@ from flare_ai_defai.prompts.library import PromptLibrary
 
 logger = structlog.get_logger(__name__)
 
+FormattedPrompt = tuple[str, str | None, type | None]
+# Prompt name and format inputs a formatted prompt is remembered under
+FormattedPromptKey = tuple[str, frozenset[tuple[str, Any]]]
+
+# Number of formatted prompts remembered for repeated inputs
+FORMATTED_CACHE_SIZE = 128
+
 
 class PromptService:
     """
@@ -39,6 +47,8 @@ class PromptService:
     Attributes:
         library (PromptLibrary): Instance of the prompt library containing all
             prompt templates
+        cache_size (int): Number of formatted prompts remembered, keyed by prompt
+            name and inputs
         logger (BoundLogger): Structured logger bound with service context
 
     Example:
@@ -61,6 +71,10 @@ class PromptService:
         with the service context.
         """
         self.library = PromptLibrary()
+        self.cache_size = FORMATTED_CACHE_SIZE
+        self._formatted: OrderedDict[FormattedPromptKey, FormattedPrompt] = (
+            OrderedDict()
+        )
         self.logger = logger.bind(service="prompt")
 
     def get_formatted_prompt(
@@ -105,6 +119,18 @@ class PromptService:
         Logs:
             - Exceptions during prompt formatting with prompt name and error details
         """
+        key: FormattedPromptKey | None
+        try:
+            key = (prompt_name, frozenset(kwargs.items()))
+            cached = self._formatted.get(key)
+        except TypeError:
+            # Unhashable inputs are formatted every time
+            key = None
+        else:
+            if cached is not None:
+                self._formatted.move_to_end(key)
+                return cached
+
         try:
             prompt = self.library.get_prompt(prompt_name)
             formatted = prompt.format(**kwargs)
@@ -113,5 +139,10 @@ class PromptService:
                 "prompt_formatting_failed", prompt_name=prompt_name, error=str(e)
             )
             raise
-        else:
-            return (formatted, prompt.response_mime_type, prompt.response_schema)
+
+        result = (formatted, prompt.response_mime_type, prompt.response_schema)
+        if key is not None:
+            self._formatted[key] = result
+            if len(self._formatted) > self.cache_size:
+                self._formatted.popitem(last=False)
+        return result
@@ -2,20 +2,42 @@
 Settings Configuration Module
 
 This module defines the configuration settings for the AI Agent API
-using Pydantic's BaseSettings. It handles environment variables and
-provides default values for various service configurations.
+as a frozen dataclass. It handles environment variables and provides
+default values for various service configurations.
 
 The settings can be overridden by environment variables or through a .env file.
 Environment variables take precedence over values defined in the .env file.
 """
 
+import os
+import sys
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Any, ClassVar, Self
+
+import orjson
 import structlog
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from web3 import Web3
+from dotenv import load_dotenv
+
 logger = structlog.get_logger(__name__)
 
+# Environment values read as True for boolean settings
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
 
-class Settings(BaseSettings):
+def _parse_env(raw: str, default: Any) -> Any:
+    """Parse an environment variable to the type of the setting's default."""
+    if isinstance(default, bool):
+        return raw.strip().lower() in _TRUTHY
+    if isinstance(default, int | float):
+        return type(default)(raw)
+    if isinstance(default, tuple):
+        return tuple(orjson.loads(raw))
+    return raw
+
+
+@dataclass(frozen=True)
+class Settings:
     """
     Application settings model that provides configuration for all components.
     """
@@ -23,7 +45,7 @@ class Settings(BaseSettings):
     # Flag to enable/disable attestation simulation
     simulate_attestation: bool = False
     # Restrict backend listener to specific IPs
-    cors_origins: list[str] = ["*"]
+    cors_origins: tuple[str, ...] = ("*",)
     # API key for accessing Google's Gemini AI service
     gemini_api_key: str = ""
     # The Gemini model identifier to use
@@ -34,80 +56,41 @@ class Settings(BaseSettings):
     web3_provider_url: str = "https://flare-api.flare.network/ext/C/rpc"
     # URL for the Flare Network block explorer
     web3_explorer_url: str = "https://flare-explorer.flare.network/"
+    # Minimum cosine similarity for a semantic cache hit, kept high because
+    # routing is sensitive to small wording changes
+    semantic_cache_threshold: float = 0.9
+    # Maximum number of responses kept per semantic cache namespace
+    semantic_cache_size: int = 256
+    # Directory the semantic caches are persisted to on shutdown, empty to disable
+    semantic_cache_dir: str = ""
 
     # FTSO Contract Settings
 
-    FTSOV2_ADDRESS: str = Web3.to_checksum_address("0xB18d3A5e5A85C65cE47f977D7F486B79F99D3d32")  # Coston2 FTSO contract
-
-    FTSOV2_ABI: list = [
-
-        {
-
-            "inputs": [{"internalType": "bytes21","name": "_feedId","type": "bytes21"}],
-
-            "name": "getFeedById",
-
-            "outputs": [
-
-                {"internalType": "uint256","name": "","type": "uint256"},
-
-                {"internalType": "int8","name": "","type": "int8"},
+    # Coston2 FTSO contract, as a checksummed literal so import skips keccak hashing
+    FTSOV2_ADDRESS: ClassVar[str] = "0xB18d3A5e5A85C65cE47f977D7F486B79F99D3d32"
 
-                {"internalType": "uint64","name": "","type": "uint64"}
+    # Multicall3 is deployed at the same address on every EVM chain, Flare included
+    MULTICALL3_ADDRESS: ClassVar[str] = "0xcA11bde05977b3631167028862bE2a173976CA11"
 
-            ],
+    # FTSO Feed IDs for supported tokens, decoded once to the bytes21 contract values
 
-            "stateMutability": "payable",
+    FTSO_FEED_IDS: ClassVar[dict[str, bytes]] = {
 
-            "type": "function"
+        "FLR": bytes.fromhex("01464c522f55534400000000000000000000000000"),  # FLR/USD
 
-        },
+        "BTC": bytes.fromhex("014254432f55534400000000000000000000000000"),  # BTC/USD
 
-        {
+        "ETH": bytes.fromhex("014554482f55534400000000000000000000000000"),  # ETH/USD
 
-            "inputs": [{"internalType": "bytes21[]","name": "_feedIds","type": "bytes21[]"}],
-
-            "name": "getFeedsById",
-
-            "outputs": [
-
-                {"internalType": "uint256[]","name": "","type": "uint256[]"},
-
-                {"internalType": "int8[]","name": "","type": "int8[]"},
-
-                {"internalType": "uint64","name": "","type": "uint64"}
-
-            ],
-
-            "stateMutability": "payable",
-
-            "type": "function"
-
-        }
-
-    ]
-
-    
+        "XRP": bytes.fromhex("015852502f55534400000000000000000000000000"),  # XRP/USD
 
-    # FTSO Feed IDs for supported tokens
+        "DOGE": bytes.fromhex("01444f47452f555344000000000000000000000000"), # DOGE/USD
 
-    FTSO_FEED_IDS: dict[str, str] = {
+        "ADA": bytes.fromhex("014144412f55534400000000000000000000000000"),  # ADA/USD
 
-        "FLR": "0x01464c522f55534400000000000000000000000000",  # FLR/USD
+        "ALGO": bytes.fromhex("01414c474f2f555344000000000000000000000000"), # ALGO/USD
 
-        "BTC": "0x014254432f55534400000000000000000000000000",  # BTC/USD
-
-        "ETH": "0x014554482f55534400000000000000000000000000",  # ETH/USD
-
-        "XRP": "0x015852502f55534400000000000000000000000000",  # XRP/USD
-
-        "DOGE": "0x01444f47452f555344000000000000000000000000", # DOGE/USD
-
-        "ADA": "0x014144412f55534400000000000000000000000000",  # ADA/USD
-
-        "ALGO": "0x01414c474f2f555344000000000000000000000000", # ALGO/USD
-
-        "SOL": "0x01534f4c2f55534400000000000000000000000000"   # SOL/USD
+        "SOL": bytes.fromhex("01534f4c2f55534400000000000000000000000000"),  # SOL/USD
 
     }
 
@@ -115,13 +98,16 @@ class Settings(BaseSettings):
 
     # List of tokens actually supported by FTSO
 
-    FTSO_SUPPORTED_TOKENS: list[str] = list(FTSO_FEED_IDS.keys())
+    FTSO_SUPPORTED_TOKENS: ClassVar[tuple[str, ...]] = tuple(
+        map(sys.intern, FTSO_FEED_IDS)
+    )
 
     
 
     # FTSO Symbol Mapping - maps various token representations to their FTSO symbol
+    # Keys and symbols are interned so lookups and comparisons hit pointer equality
 
-    FTSO_SYMBOLS: dict[str, str] = {
+    FTSO_SYMBOLS: ClassVar[dict[str, str]] = {sys.intern(k): sys.intern(v) for k, v in {
 
         # Native token variations
 
@@ -197,18 +183,61 @@ class Settings(BaseSettings):
 
         "SOLANA": "SOL"
 
-    }
+    }.items()}
 
-    model_config = SettingsConfigDict(
-        # This enables .env file support
-        env_file=".env",
-        # If .env file is not found, don't raise an error
-        env_file_encoding="utf-8",
-        # Optional: you can also specify multiple .env files
-        extra="ignore",
-    )
+    @classmethod
+    def from_env(cls) -> Self:
+        """
+        Create settings from the environment.
 
+        Each field is overridden by the upper-cased environment variable of the
+        same name, e.g. ``GEMINI_API_KEY``, parsed to the type of its default.
 
-# Create a global settings instance
-settings = Settings()
-logger.debug("settings", settings=settings.model_dump())
+        Returns:
+            Settings: Settings with environment overrides applied
+        """
+        overrides = {}
+        for field in fields(cls):
+            raw = os.environ.get(field.name.upper())
+            if raw is not None:
+                overrides[field.name] = _parse_env(raw, field.default)
+        return cls(**overrides)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the process-wide settings instance, reading the environment once.
+
+    Values from a ``.env`` file in the working directory are loaded first, without
+    overriding variables that are already set.
+
+    Usable as a FastAPI dependency, e.g. ``Depends(get_settings)``.
+
+    Returns:
+        Settings: The shared settings instance
+    """
+    load_dotenv(override=False)
+    settings = Settings.from_env()
+    # Passed as is, so the dataclass repr is only built if the record is rendered
+    logger.debug("settings", settings=settings)
+    return settings
+
+
+# Global settings instance, created on first access by __getattr__
+settings: Settings
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Create the global settings instance on first access (PEP 562).
+
+    Importing this module stays cheap; the environment and .env lookup only run
+    once the settings are actually used.
+    """
+    if name == "settings":
+        global settings  # noqa: PLW0603
+        settings = get_settings()
+        return settings
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
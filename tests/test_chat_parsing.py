@@ -0,0 +1,58 @@
+# pyright: reportPrivateUsage=false
+
+import pytest
+
+from flare_ai_defai.api.routes.chat import _keyword_route, _parse_send, _parse_swap
+from flare_ai_defai.prompts import SemanticRouterResponse
+
+ADDRESS = "0x" + "aB" * 20
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("Swap 10 FLR for USDC", (10.0, "FLR", "USDC")),
+        ("swap 1.5 WFLR to JOULE", (1.5, "WFLR", "JOULE")),
+        ("Swap 2.25 FLR, USDC.", (2.25, "FLR", "USDC")),
+        ("please swap 3 FLR into USDT!", (3.0, "FLR", "USDT")),
+        ("Swap 5 flr for usdc", None),
+        ("Swap FLR for USDC", None),
+        ("Swap 5 FLR", None),
+        ("", None),
+    ],
+)
+def test_parse_swap(message: str, expected: tuple[float, str, str] | None) -> None:
+    assert _parse_swap(message) == expected
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        (f"Send 1.5 FLR to {ADDRESS}", (1.5, ADDRESS)),
+        (f"send to {ADDRESS} 2 FLR", (2.0, ADDRESS)),
+        (f"Send 0.25 FLR to {ADDRESS}.", (0.25, ADDRESS)),
+        (f"Send 3 FLR to {ADDRESS} and 4 FLR to 0x{'1' * 40}", (3.0, ADDRESS)),
+        ("Send 7 FLR to my friend", (7.0, None)),
+        (f"Send FLR to {ADDRESS}", (None, ADDRESS)),
+        ("Send 5 FLR to 0x1234", (5.0, None)),
+    ],
+)
+def test_parse_send(message: str, expected: tuple[float | None, str | None]) -> None:
+    assert _parse_send(message) == expected
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("Swap 10 FLR for USDC", SemanticRouterResponse.SWAP_TOKEN),
+        ("  swap 1.5 WFLR to JOULE", SemanticRouterResponse.SWAP_TOKEN),
+        ("swap some tokens", None),
+        (f"Send 1 FLR to {ADDRESS}", SemanticRouterResponse.SEND_TOKEN),
+        ("send 1 FLR to my friend", None),
+        ("Price of bitcoin", SemanticRouterResponse.COIN_INFO),
+        ("what is the price of bitcoin", None),
+        ("hello there", None),
+    ],
+)
+def test_keyword_route(message: str, expected: SemanticRouterResponse | None) -> None:
+    assert _keyword_route(message) == expected
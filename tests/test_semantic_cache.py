@@ -0,0 +1,110 @@
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from flare_ai_defai.ai import SemanticCache
+
+
+def letter_encoder(texts: list[str]) -> np.ndarray:
+    """Bag-of-letters embedding, good enough to tell paraphrases apart."""
+    vectors = np.zeros((len(texts), 26), dtype=np.float32)
+    for i, text in enumerate(texts):
+        for char in text.lower():
+            if "a" <= char <= "z":
+                vectors[i, ord(char) - ord("a")] += 1
+    return vectors
+
+
+def test_get_or_compute_serves_similar_prompts() -> None:
+    cache = SemanticCache("test", threshold=0.9, encoder=letter_encoder)
+    calls: list[str] = []
+
+    def compute() -> str:
+        calls.append("called")
+        return "CoinInfo"
+
+    assert cache.get_or_compute("price of bitcoin", compute) == "CoinInfo"
+    assert cache.get_or_compute("price of bitcoin?", compute) == "CoinInfo"
+    assert len(calls) == 1
+    assert cache.get("create a new wallet") is None
+
+
+def test_lru_eviction() -> None:
+    cache = SemanticCache("test", threshold=0.99, max_size=2, encoder=letter_encoder)
+    cache.put("alpha", "a")
+    cache.put("bravo", "b")
+    assert cache.get("alpha") == "a"
+    cache.put("charlie", "c")
+    assert len(cache) == cache.max_size
+    assert cache.get("bravo") is None
+    assert cache.get("alpha") == "a"
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    cache = SemanticCache("test", encoder=letter_encoder)
+    cache.put("swap 10 FLR for USDC", "SwapToken")
+    cache.save(tmp_path)
+
+    restored = SemanticCache("test", encoder=letter_encoder)
+    restored.load(tmp_path)
+    assert restored.get("swap 10 FLR for USDC") == "SwapToken"
+
+
+def test_exact_cache_ignores_paraphrases() -> None:
+    cache = SemanticCache("test", threshold=0.5, encoder=letter_encoder, exact=True)
+    cache.put("price of BTC", '{"token": "BTC"}')
+    assert cache.get("price of ETH") is None
+    assert cache.get("price of BTC") == '{"token": "BTC"}'
+
+
+def test_model_load_failure_falls_back_to_exact_matching(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loads: list[str] = []
+
+    class UnavailableModel:
+        def __init__(self, model_name: str) -> None:
+            loads.append(model_name)
+            raise OSError(model_name)
+
+    monkeypatch.setitem(
+        sys.modules,
+        "sentence_transformers",
+        SimpleNamespace(SentenceTransformer=UnavailableModel),
+    )
+    cache = SemanticCache("test", model_name="unreachable-test-model")
+    cache.warm_up()
+
+    async def compute() -> str:
+        return "Conversational"
+
+    assert asyncio.run(cache.aget_or_compute("hello", compute)) == "Conversational"
+    assert cache.get("hello") == "Conversational"
+    assert cache.get("hello there") is None
+    assert loads == ["unreachable-test-model"]
+
+
+def test_failed_compute_is_not_cached() -> None:
+    cache = SemanticCache("test", encoder=letter_encoder)
+
+    async def invalid() -> str:
+        msg = "invalid model output"
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match="invalid model output"):
+        asyncio.run(cache.aget_or_compute("route this", invalid))
+    assert len(cache) == 0
+
+
+def test_save_and_load_exact(tmp_path: Path) -> None:
+    cache = SemanticCache("test", encoder=letter_encoder, exact=True)
+    cache.put("price of BTC", '{"token": "BTC"}')
+    cache.save(tmp_path)
+
+    restored = SemanticCache("test", encoder=letter_encoder, exact=True)
+    restored.load(tmp_path)
+    assert restored.get("price of BTC") == '{"token": "BTC"}'
@@ -0,0 +1,17 @@
+from web3 import Web3
+
+from flare_ai_defai.settings import settings
+
+FEED_ID_SIZE = 21  # FTSOv2 feed IDs are bytes21
+
+
+def test_ftsov2_address_is_checksummed() -> None:
+    assert Web3.to_checksum_address(settings.FTSOV2_ADDRESS) == settings.FTSOV2_ADDRESS
+
+
+def test_feed_ids_are_bytes21() -> None:
+    assert settings.FTSO_FEED_IDS["BTC"] == bytes.fromhex(
+        "014254432f55534400000000000000000000000000"
+    )
+    for feed_id in settings.FTSO_FEED_IDS.values():
+        assert len(feed_id) == FEED_ID_SIZE